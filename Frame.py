@@ -1,12 +1,133 @@
+import os
 import sys
 import json
+from functools import lru_cache
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QWidget, QLineEdit, QLabel, QPushButton,
-    QHBoxLayout, QComboBox, QFormLayout, QGroupBox, QFileDialog, QMessageBox, QCheckBox
+    QHBoxLayout, QComboBox, QFormLayout, QGroupBox, QFileDialog, QMessageBox, QCheckBox, QToolButton
 )
 import numpy as np
-from Plotter import FluidDiagramPlotter, MplCanvas
-from PyQt5.QtCore import Qt, QTimer
+from Plotter import FluidDiagramPlotter, MplCanvas, PgCanvas, defer_draw
+from PyQt5.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Conversion factors to the SI base unit of each quantity.
+_P_FACTORS = {'Pa': 1.0, 'hPa': 100.0, 'kPa': 1000.0, 'mbar': 100.0, 'bar': 100000.0, 'psi': 6894.76, 'MPa': 1e6}
+_S_FACTORS = {'J/kgK': 1.0, 'kJ/kgK': 1000.0, 'MJ/kgK': 1e6}
+_H_FACTORS = {'J/kg': 1.0, 'kJ/kg': 1000.0, 'MJ/kg': 1e6}
+_V_FACTORS = {'m^3/kg': 1.0, 'l/kg': 0.001}
+
+# Quantities shown on the (x, y) axes of each diagram type.
+_AXIS_FIELDS = {
+    'Ts': ('s', 'T'),
+    'hs': ('s', 'h'),
+    'logph': ('h', 'p'),
+    'Th': ('h', 'T'),
+    'plogv': ('v', 'p')
+}
+
+# (diagram_type, axis) -> quantity shown on that axis.
+_AXIS_CONVERTER = {
+    (diagram_type, axis): field
+    for diagram_type, fields in _AXIS_FIELDS.items()
+    for axis, field in zip(('x', 'y'), fields)
+}
+
+# Precomputed (old_unit, new_unit) -> multiplier lookups.
+_P_RATIO = {(a, b): _P_FACTORS[a] / _P_FACTORS[b] for a in _P_FACTORS for b in _P_FACTORS}
+_S_RATIO = {(a, b): _S_FACTORS[a] / _S_FACTORS[b] for a in _S_FACTORS for b in _S_FACTORS}
+_H_RATIO = {(a, b): _H_FACTORS[a] / _H_FACTORS[b] for a in _H_FACTORS for b in _H_FACTORS}
+_V_RATIO = {(a, b): _V_FACTORS[a] / _V_FACTORS[b] for a in _V_FACTORS for b in _V_FACTORS}
+_RATIOS = {'p': _P_RATIO, 's': _S_RATIO, 'h': _H_RATIO, 'v': _V_RATIO}
+
+# Temperature conversions are affine: (old_unit, new_unit) -> (scale, offset).
+_T_AFFINE = {
+    ('K', 'K'): (1.0, 0.0), ('K', '°C'): (1.0, -273.15), ('K', '°F'): (1.8, -459.67),
+    ('°C', 'K'): (1.0, 273.15), ('°C', '°C'): (1.0, 0.0), ('°C', '°F'): (1.8, 32.0),
+    ('°F', 'K'): (5 / 9, 255.37222222222223), ('°F', '°C'): (5 / 9, -17.77777777777778), ('°F', '°F'): (1.0, 0.0)
+}
+
+
+def _field_transform(field, old_unit, new_unit):
+    """
+    Return the (scale, offset) pair converting a quantity from old_unit to new_unit.
+    """
+    if field == 'T':
+        return _T_AFFINE[(old_unit, new_unit)]
+    return _RATIOS[field][(old_unit, new_unit)], 0.0
+
+
+def _compute_axis_transform(diagram_type, old_units, new_units):
+    """
+    Return the (scale_x, offset_x, scale_y, offset_y) transform of the diagram axes for a unit change.
+    """
+    if diagram_type not in _AXIS_FIELDS:
+        return 1.0, 0.0, 1.0, 0.0
+    x_field, y_field = _AXIS_FIELDS[diagram_type]
+    return (*_field_transform(x_field, old_units[x_field], new_units[x_field]),
+            *_field_transform(y_field, old_units[y_field], new_units[y_field]))
+
+
+@lru_cache(maxsize=64)
+def _lin(start, end, points):
+    """
+    Return a cached, read-only array of linearly spaced isoline values.
+    """
+    values = np.linspace(start, end, points)
+    values.flags.writeable = False
+    return values
+
+
+@lru_cache(maxsize=64)
+def _geo(start, end, points):
+    """
+    Return a cached, read-only array of geometrically spaced isoline values.
+    """
+    values = np.geomspace(start, end, points)
+    values.flags.writeable = False
+    return values
+
+
+class DiagramJobSignals(QObject):
+    """
+    Signals emitted by a DiagramJob when the calculation is done.
+    """
+    finished = pyqtSignal(object, object)
+    failed = pyqtSignal(object, str)
+
+
+class DiagramJob(QRunnable):
+    """
+    Background job calculating the isolines of a fluid property diagram.
+
+    Only the CoolProp-heavy isoline calculation runs in the worker thread; drawing the plot stays on
+    the GUI thread, since Matplotlib artists are not thread-safe.
+    """
+
+    def __init__(self, key, fluid, unit_system, isoline_settings):
+        super(DiagramJob, self).__init__()
+        self.key = key
+        self.fluid = fluid
+        self.unit_system = unit_system
+        self.isoline_settings = isoline_settings
+        self.signals = DiagramJobSignals()
+
+    def run(self):
+        """
+        Calculate the diagram and emit it together with its cache key.
+        """
+        try:
+            diagram = FluidDiagramPlotter.build_diagram(self.fluid, self.unit_system, self.isoline_settings)
+        except Exception as e:
+            self.signals.failed.emit(self.key, str(e))
+            return
+        self.signals.finished.emit(self.key, diagram)
+
 
 class MainWindow(QMainWindow):
     """
@@ -18,6 +139,29 @@ class MainWindow(QMainWindow):
         self.setWindowTitle('Interactive Fluid Diagram Plot')
         self.setGeometry(200, 200, 1200, 1000)
 
+        self.field_converters = {
+            'T': self.convert_temperature,
+            'p': self.convert_pressure,
+            's': self.convert_entropy,
+            'h': self.convert_enthalpy,
+            'v': self.convert_volume
+        }
+
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(300)
+        self._debounce_timer.timeout.connect(self.auto_update_plot)
+
+        self.plotter = None
+        self._plot_key = None
+        self._states_key = None
+        self._diagram_jobs = {}
+        self._isoline_settings = None
+        self._dirty = True
+        self._isoline_summaries = []
+        self._json_cache = {}
+        self._fluid_states_soa = None
+
         self.initUI()
         self.connect_signals()
         self.show()
@@ -30,6 +174,7 @@ class MainWindow(QMainWindow):
         Initialize the User Interface components and layout.
         """
         self.canvas = MplCanvas(self, width=6, height=10, dpi=100)
+        self.pg_canvas = PgCanvas(self) if PgCanvas is not None else None
         self.create_input_fields()
         self.create_layouts()
         self.create_file_input_section()
@@ -81,6 +226,14 @@ class MainWindow(QMainWindow):
         self.auto_update_checkbox = QCheckBox('Automatic Update', self)
         self.auto_update_checkbox.setToolTip('Automatically update the plot after changes')
 
+        self.fast_preview_checkbox = QCheckBox('Fast Preview', self)
+        if self.pg_canvas is not None:
+            self.fast_preview_checkbox.setToolTip('Show an interactive pyqtgraph preview; downloads still use Matplotlib')
+            self.fast_preview_checkbox.toggled.connect(self.toggle_fast_preview)
+        else:
+            self.fast_preview_checkbox.setToolTip('Fast preview requires pyqtgraph to be installed')
+            self.fast_preview_checkbox.setEnabled(False)
+
     def create_isoline_input_fields(self, start, end, points, color, style, linewidth='1.0'):
         """
         Helper function to create input fields for isoline settings.
@@ -112,6 +265,9 @@ class MainWindow(QMainWindow):
         self.main_widget = QWidget()
         main_layout = QVBoxLayout(self.main_widget)
         main_layout.addWidget(self.canvas)
+        if self.pg_canvas is not None:
+            self.pg_canvas.hide()
+            main_layout.addWidget(self.pg_canvas)
 
         settings_layout = QHBoxLayout()
         settings_layout.addWidget(fluid_group)
@@ -123,6 +279,7 @@ class MainWindow(QMainWindow):
 
         auto_update_layout = QHBoxLayout()
         auto_update_layout.addWidget(self.auto_update_checkbox)
+        auto_update_layout.addWidget(self.fast_preview_checkbox)
         main_layout.addLayout(auto_update_layout)
 
     def create_file_input_section(self):
@@ -225,36 +382,68 @@ class MainWindow(QMainWindow):
 
         layout.addLayout(header_layout)
 
-        layout.addLayout(self.create_isoline_row('Vapor Fraction (Q):', self.q_start_input, self.q_end_input, self.q_points_input, self.q_color_input, self.q_style_input, self.q_linewidth_input))
-        layout.addLayout(self.create_isoline_row('Temperature (T):', self.t_start_input, self.t_end_input, self.t_points_input, self.t_color_input, self.t_style_input, self.t_linewidth_input))
-        layout.addLayout(self.create_isoline_row('Pressure (P):', self.p_start_input, self.p_end_input, self.p_points_input, self.p_color_input, self.p_style_input, self.p_linewidth_input))
-        layout.addLayout(self.create_isoline_row('Specific Volume (V):', self.v_start_input, self.v_end_input, self.v_points_input, self.v_color_input, self.v_style_input, self.v_linewidth_input))
-        layout.addLayout(self.create_isoline_row('Entropy (S):', self.s_start_input, self.s_end_input, self.s_points_input, self.s_color_input, self.s_style_input, self.s_linewidth_input))
-        layout.addLayout(self.create_isoline_row('Enthalpy (H):', self.h_start_input, self.h_end_input, self.h_points_input, self.h_color_input, self.h_style_input, self.h_linewidth_input))
+        rows = [
+            self.create_isoline_row('Vapor Fraction (Q):', self.q_start_input, self.q_end_input, self.q_points_input, self.q_color_input, self.q_style_input, self.q_linewidth_input, expanded=True),
+            self.create_isoline_row('Temperature (T):', self.t_start_input, self.t_end_input, self.t_points_input, self.t_color_input, self.t_style_input, self.t_linewidth_input, expanded=True),
+            self.create_isoline_row('Pressure (P):', self.p_start_input, self.p_end_input, self.p_points_input, self.p_color_input, self.p_style_input, self.p_linewidth_input),
+            self.create_isoline_row('Specific Volume (V):', self.v_start_input, self.v_end_input, self.v_points_input, self.v_color_input, self.v_style_input, self.v_linewidth_input),
+            self.create_isoline_row('Entropy (S):', self.s_start_input, self.s_end_input, self.s_points_input, self.s_color_input, self.s_style_input, self.s_linewidth_input),
+            self.create_isoline_row('Enthalpy (H):', self.h_start_input, self.h_end_input, self.h_points_input, self.h_color_input, self.h_style_input, self.h_linewidth_input)
+        ]
+
+        # The toggle buttons show an arrow next to the label, so size them to fit the longest label.
+        toggle_buttons = [row.itemAt(0).widget() for row in rows]
+        toggle_width = max([150] + [button.sizeHint().width() for button in toggle_buttons])
+        header_layout.itemAt(0).widget().setFixedWidth(toggle_width)
+        for row, toggle_button in zip(rows, toggle_buttons):
+            toggle_button.setFixedWidth(toggle_width)
+            layout.addLayout(row)
 
         return layout
 
-    def create_isoline_row(self, label, start_input, end_input, points_input, color_input, style_input, linewidth_input):
+    def create_isoline_row(self, label, start_input, end_input, points_input, color_input, style_input, linewidth_input, expanded=False):
         """
-        Helper function to create a row of isoline settings.
+        Helper function to create a collapsible row of isoline settings.
+
+        Collapsed rows hide their input widgets, which keeps them out of layout and painting until the
+        row is expanded. In their place, a label summarizes the number of isolines and their range.
         """
         row_layout = QHBoxLayout()
-        label_widget = QLabel(label)
-        label_widget.setFixedWidth(150)
-        row_layout.addWidget(label_widget)
-        row_layout.addWidget(start_input)
-        row_layout.addWidget(end_input)
-        row_layout.addWidget(points_input)
-        row_layout.addWidget(color_input)
-        row_layout.addWidget(style_input)
-        row_layout.addWidget(linewidth_input)
-
-        for i in range(row_layout.count()):
-            widget = row_layout.itemAt(i).widget()
-            widget.setFixedWidth(100)
-
+        inputs = (start_input, end_input, points_input, color_input, style_input, linewidth_input)
+        summary_label = QLabel()
+        toggle_button = QToolButton()
+        toggle_button.setText(label)
+        toggle_button.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
+        toggle_button.setCheckable(True)
+        toggle_button.setChecked(expanded)
+        toggle_button.toggled.connect(lambda checked: self.toggle_isoline_row(toggle_button, inputs, summary_label, checked))
+        row_layout.addWidget(toggle_button)
+        for input_widget in inputs:
+            input_widget.setFixedWidth(100)
+            row_layout.addWidget(input_widget)
+        row_layout.addWidget(summary_label)
+
+        self._isoline_summaries.append((summary_label, start_input, end_input, points_input))
+        self.update_isoline_summary(summary_label, start_input, end_input, points_input)
+        self.toggle_isoline_row(toggle_button, inputs, summary_label, expanded)
         return row_layout
 
+    def toggle_isoline_row(self, toggle_button, inputs, summary_label, expanded):
+        """
+        Expand or collapse a row of isoline settings.
+        """
+        toggle_button.setArrowType(Qt.DownArrow if expanded else Qt.RightArrow)
+        for input_widget in inputs:
+            input_widget.setVisible(expanded)
+        summary_label.setVisible(not expanded)
+
+    @staticmethod
+    def update_isoline_summary(summary_label, start_input, end_input, points_input):
+        """
+        Show the number of isolines and their range in the summary label of a collapsed row.
+        """
+        summary_label.setText(f"{points_input.text()} lines, {start_input.text()} to {end_input.text()}")
+
     def create_line_edit(self, default_text='', tooltip='', placeholder=False):
         """
         Create a QLineEdit with the given default text and tooltip.
@@ -296,13 +485,30 @@ class MainWindow(QMainWindow):
             self.v_start_input, self.v_end_input, self.v_points_input,
             self.s_start_input, self.s_end_input, self.s_points_input,
             self.h_start_input, self.h_end_input, self.h_points_input,
-            self.fluid_states_input,
-            self.connections_input
+            self.q_linewidth_input, self.t_linewidth_input, self.p_linewidth_input,
+            self.v_linewidth_input, self.s_linewidth_input, self.h_linewidth_input
         ]
 
+        # Edited values are committed on Enter or focus-out rather than on every keystroke.
         for widget in line_edit_widgets:
+            widget.editingFinished.connect(self.mark_update_needed)
+
+        # The file inputs are filled in programmatically by the file dialogs, which does not emit editingFinished.
+        for widget in [self.fluid_states_input, self.connections_input]:
             widget.textChanged.connect(self.mark_update_needed)
 
+        isoline_setting_widgets = [
+            self.q_start_input, self.q_end_input, self.q_points_input,
+            self.t_start_input, self.t_end_input, self.t_points_input,
+            self.p_start_input, self.p_end_input, self.p_points_input,
+            self.v_start_input, self.v_end_input, self.v_points_input,
+            self.s_start_input, self.s_end_input, self.s_points_input,
+            self.h_start_input, self.h_end_input, self.h_points_input
+        ]
+
+        for widget in isoline_setting_widgets:
+            widget.textChanged.connect(self.mark_inputs_dirty)
+
         combo_box_widgets = [
             self.unit_system_p, self.unit_system_T, self.unit_system_s,
             self.unit_system_h, self.unit_system_v, self.unit_system_Q,
@@ -346,27 +552,11 @@ class MainWindow(QMainWindow):
         if not start_input.text().strip() or not end_input.text().strip():
             return
 
-        start_value = float(start_input.text())
-        end_value = float(end_input.text())
-
-        if field_type == 'T':
-            start_value = self.convert_temperature(start_value, old_unit, new_unit)
-            end_value = self.convert_temperature(end_value, old_unit, new_unit)
-        elif field_type == 'p':
-            start_value = self.convert_pressure(start_value, old_unit, new_unit)
-            end_value = self.convert_pressure(end_value, old_unit, new_unit)
-        elif field_type == 's':
-            start_value = self.convert_entropy(start_value, old_unit, new_unit)
-            end_value = self.convert_entropy(end_value, old_unit, new_unit)
-        elif field_type == 'h':
-            start_value = self.convert_enthalpy(start_value, old_unit, new_unit)
-            end_value = self.convert_enthalpy(end_value, old_unit, new_unit)
-        elif field_type == 'v':
-            start_value = self.convert_volume(start_value, old_unit, new_unit)
-            end_value = self.convert_volume(end_value, old_unit, new_unit)
-
-        start_input.setText(str(start_value))
-        end_input.setText(str(end_value))
+        converter = self.field_converters[field_type]
+        start_value, end_value = converter(np.array([float(start_input.text()), float(end_input.text())]), old_unit, new_unit)
+
+        self.set_text_quiet(start_input, f"{start_value:.6g}")
+        self.set_text_quiet(end_input, f"{end_value:.6g}")
 
     def convert_diagram_axis_limits(self, old_units, new_units):
         """
@@ -376,116 +566,65 @@ class MainWindow(QMainWindow):
             return  # Do nothing if any of the axis limits are empty
 
         diagram_type = self.diagram_type_input.currentText()
-        x_old_unit, y_old_unit = self.get_axis_units(diagram_type, old_units)
-        x_unit, y_unit = self.get_axis_units(diagram_type, new_units)
+        sx, ox, sy, oy = _compute_axis_transform(diagram_type, old_units, new_units)
 
-        x_min = self.convert_value(float(self.xmin_input.text()), x_old_unit, x_unit, diagram_type, axis='x')
-        x_max = self.convert_value(float(self.xmax_input.text()), x_old_unit, x_unit, diagram_type, axis='x')
-        y_min = self.convert_value(float(self.ymin_input.text()), y_old_unit, y_unit, diagram_type, axis='y')
-        y_max = self.convert_value(float(self.ymax_input.text()), y_old_unit, y_unit, diagram_type, axis='y')
+        limit_inputs = (self.xmin_input, self.xmax_input, self.ymin_input, self.ymax_input)
+        limits = np.array([float(limit_input.text()) for limit_input in limit_inputs])
+        limits[:2] = sx * limits[:2] + ox
+        limits[2:] = sy * limits[2:] + oy
 
-        self.xmin_input.setText(str(x_min))
-        self.xmax_input.setText(str(x_max))
-        self.ymin_input.setText(str(y_min))
-        self.ymax_input.setText(str(y_max))
+        for limit_input, limit in zip(limit_inputs, limits):
+            self.set_text_quiet(limit_input, f"{limit:.6g}")
 
     def get_axis_units(self, diagram_type, units):
         """
         Get the units of the x and y axes based on the diagram type.
         """
-        if diagram_type == 'Ts':
-            return units['s'], units['T']
-        elif diagram_type == 'hs':
-            return units['s'], units['h']
-        elif diagram_type == 'logph':
-            return units['h'], units['p']
-        elif diagram_type == 'Th':
-            return units['h'], units['T']
-        elif diagram_type == 'plogv':
-            return units['v'], units['p']
-        return None, None
+        if diagram_type not in _AXIS_FIELDS:
+            return None, None
+        x_field, y_field = _AXIS_FIELDS[diagram_type]
+        return units[x_field], units[y_field]
 
     def convert_value(self, value, old_unit, new_unit, diagram_type, axis):
         """
-        Convert the axis value based on the units of the diagram type.
+        Convert the axis value (or array of values) based on the units of the diagram type.
         """
-        if old_unit == new_unit:
+        field = _AXIS_CONVERTER.get((diagram_type, axis))
+        if old_unit == new_unit or field is None:
             return value
-        if diagram_type in ['Ts', 'Th']:
-            if axis == 'x':
-                return self.convert_entropy(value, old_unit, new_unit)
-            elif axis == 'y':
-                return self.convert_temperature(value, old_unit, new_unit)
-        elif diagram_type in ['hs', 'logph']:
-            if axis == 'x':
-                return self.convert_enthalpy(value, old_unit, new_unit)
-            elif axis == 'y':
-                return self.convert_pressure(value, old_unit, new_unit)
-        elif diagram_type == 'plogv':
-            if axis == 'x':
-                return self.convert_volume(value, old_unit, new_unit)
-            elif axis == 'y':
-                return self.convert_pressure(value, old_unit, new_unit)
-        return value
+        scale, offset = _field_transform(field, old_unit, new_unit)
+        return np.asarray(value) * scale + offset
 
     def convert_temperature(self, value, old_unit, new_unit):
         """
-        Convert temperature between different units.
+        Convert temperature (a scalar or an array of values) between different units.
         """
-        if old_unit == new_unit:
-            return value
-        if old_unit == 'K':
-            if new_unit == '°C':
-                return value - 273.15
-            elif new_unit == '°F':
-                return (value - 273.15) * 9/5 + 32
-        elif old_unit == '°C':
-            if new_unit == 'K':
-                return value + 273.15
-            elif new_unit == '°F':
-                return value * 9/5 + 32
-        elif old_unit == '°F':
-            if new_unit == 'K':
-                return (value - 32) * 5/9 + 273.15
-            elif new_unit == '°C':
-                return (value - 32) * 5/9
-        return value
+        scale, offset = _T_AFFINE[(old_unit, new_unit)]
+        return np.asarray(value) * scale + offset
 
     def convert_pressure(self, value, old_unit, new_unit):
         """
-        Convert pressure between different units.
+        Convert pressure (a scalar or an array of values) between different units.
         """
-        conversion_factors = {
-            'Pa': 1, 'hPa': 100, 'kPa': 1000, 'mbar': 100, 'bar': 100000, 'psi': 6894.76, 'MPa': 1e6
-        }
-        return value * conversion_factors[old_unit] / conversion_factors[new_unit]
+        return np.asarray(value) * _P_RATIO[(old_unit, new_unit)]
 
     def convert_entropy(self, value, old_unit, new_unit):
         """
-        Convert entropy between different units.
+        Convert entropy (a scalar or an array of values) between different units.
         """
-        conversion_factors = {
-            'J/kgK': 1, 'kJ/kgK': 1000, 'MJ/kgK': 1e6
-        }
-        return value * conversion_factors[old_unit] / conversion_factors[new_unit]
+        return np.asarray(value) * _S_RATIO[(old_unit, new_unit)]
 
     def convert_enthalpy(self, value, old_unit, new_unit):
         """
-        Convert enthalpy between different units.
+        Convert enthalpy (a scalar or an array of values) between different units.
         """
-        conversion_factors = {
-            'J/kg': 1, 'kJ/kg': 1000, 'MJ/kg': 1e6
-        }
-        return value * conversion_factors[old_unit] / conversion_factors[new_unit]
+        return np.asarray(value) * _H_RATIO[(old_unit, new_unit)]
 
     def convert_volume(self, value, old_unit, new_unit):
         """
-        Convert specific volume between different units.
+        Convert specific volume (a scalar or an array of values) between different units.
         """
-        conversion_factors = {
-            'm^3/kg': 1, 'l/kg': 0.001
-        }
-        return value * conversion_factors[old_unit] / conversion_factors[new_unit]
+        return np.asarray(value) * _V_RATIO[(old_unit, new_unit)]
 
     def update_default_isoline_values(self):
         """
@@ -505,56 +644,67 @@ class MainWindow(QMainWindow):
         """
         Helper function to set default values for isoline settings.
         """
-        self.h_start_input.setText(h_start)
-        self.h_end_input.setText(h_end)
-        self.p_start_input.setText(p_start)
-        self.p_end_input.setText(p_end)
-        self.s_start_input.setText(s_start)
-        self.s_end_input.setText(s_end)
-        self.t_start_input.setText(t_start)
-        self.t_end_input.setText(t_end)
-        self.v_start_input.setText(v_start)
-        self.v_end_input.setText(v_end)
-        self.q_start_input.setText(q_start)
-        self.q_end_input.setText(q_end)
+        defaults = [
+            (self.h_start_input, h_start), (self.h_end_input, h_end),
+            (self.p_start_input, p_start), (self.p_end_input, p_end),
+            (self.s_start_input, s_start), (self.s_end_input, s_end),
+            (self.t_start_input, t_start), (self.t_end_input, t_end),
+            (self.v_start_input, v_start), (self.v_end_input, v_end),
+            (self.q_start_input, q_start), (self.q_end_input, q_end)
+        ]
+        for line_edit, text in defaults:
+            self.set_text_quiet(line_edit, text)
 
     def update_axis_limits(self, diagram_type):
         """
         Update the axis limits based on the selected diagram type.
         """
-        if diagram_type == 'Ts':
-            self.xmin_input.setText(self.s_start_input.text())
-            self.xmax_input.setText(self.s_end_input.text())
-            self.ymin_input.setText(self.t_start_input.text())
-            self.ymax_input.setText(self.t_end_input.text())
-        elif diagram_type == 'hs':
-            self.xmin_input.setText(self.s_start_input.text())
-            self.xmax_input.setText(self.s_end_input.text())
-            self.ymin_input.setText(self.h_start_input.text())
-            self.ymax_input.setText(self.h_end_input.text())
-        elif diagram_type == 'logph':
-            self.xmin_input.setText(self.h_start_input.text())
-            self.xmax_input.setText(self.h_end_input.text())
-            self.ymin_input.setText(self.p_start_input.text())
-            self.ymax_input.setText(self.p_end_input.text())
-        elif diagram_type == 'Th':
-            self.xmin_input.setText(self.h_start_input.text())
-            self.xmax_input.setText(self.h_end_input.text())
-            self.ymin_input.setText(self.t_start_input.text())
-            self.ymax_input.setText(self.t_end_input.text())
-        elif diagram_type == 'plogv':
-            self.xmin_input.setText(self.v_start_input.text())
-            self.xmax_input.setText(self.v_end_input.text())
-            self.ymin_input.setText(self.p_start_input.text())
-            self.ymax_input.setText(self.p_end_input.text())
+        if diagram_type not in _AXIS_FIELDS:
+            return
+
+        range_inputs = {
+            'T': (self.t_start_input, self.t_end_input),
+            'p': (self.p_start_input, self.p_end_input),
+            's': (self.s_start_input, self.s_end_input),
+            'h': (self.h_start_input, self.h_end_input),
+            'v': (self.v_start_input, self.v_end_input)
+        }
+        x_field, y_field = _AXIS_FIELDS[diagram_type]
+        limit_inputs = (self.xmin_input, self.xmax_input, self.ymin_input, self.ymax_input)
+        for limit_input, range_input in zip(limit_inputs, range_inputs[x_field] + range_inputs[y_field]):
+            self.set_text_quiet(limit_input, range_input.text())
+
+    def set_text_quiet(self, line_edit, text):
+        """
+        Set the text of a line edit without emitting its change signals, skipping no-op writes.
+
+        Callers are responsible for calling mark_update_needed once after a batch of changes.
+        """
+        if line_edit.text() == text:
+            return
+        line_edit.blockSignals(True)
+        line_edit.setText(text)
+        line_edit.blockSignals(False)
+        self.mark_inputs_dirty()
+
+    def mark_inputs_dirty(self):
+        """
+        Invalidate the cached isoline settings after an isoline input field changed.
+        """
+        self._dirty = True
+        for summary in self._isoline_summaries:
+            self.update_isoline_summary(*summary)
 
     def mark_update_needed(self):
         """
         Mark the update button as needing to be pressed by changing its color.
+
+        When automatic updates are enabled, (re)start the debounce timer so that a burst
+        of changes results in a single plot update.
         """
         self.update_button.setStyleSheet("background-color: red; color: white;")
         if self.auto_update_checkbox.isChecked():
-            QTimer.singleShot(2000, self.auto_update_plot)
+            self._debounce_timer.start()
 
     def auto_update_plot(self):
         """
@@ -566,31 +716,117 @@ class MainWindow(QMainWindow):
         """
         Update the plot based on the user-defined parameters.
         """
-        try:
-            self.load_json_files()
-            fluid = self.fluid_input.text()
-            unit_system = self.get_unit_system()
-            diagram_type = self.diagram_type_input.currentText()
-            xmin, xmax, ymin, ymax = self.get_axis_limits()
-            isoline_settings = self.get_isoline_settings()
-            isoline_styles = self.get_isoline_styles()
-
-            self.canvas.figure.clear()
-            self.canvas.axes = self.canvas.figure.add_subplot(111)
-
-            self.plotter = FluidDiagramPlotter(
-                self.canvas.figure, self.canvas.axes, fluid_states=self.fluid_states,
-                fluid=fluid, unit_system=unit_system, diagram_type=diagram_type,
-                x_min=xmin, x_max=xmax, y_min=ymin, y_max=ymax, isoline_settings=isoline_settings,
-                isoline_styles=isoline_styles
-            )
-            self.plotter.create_plot(self.connections)
-            self.canvas.draw()
-            self.update_button.setStyleSheet("")
-        except ValueError as e:
-            self.show_error_message(f"Error: {str(e)}")
-        except Exception as e:
-            self.show_error_message(f"Unexpected Error: {str(e)}")
+        # Coalesce the draw requests of this update into a single redraw.
+        with defer_draw(self.canvas):
+            try:
+                self.load_json_files()
+                fluid = self.fluid_input.text()
+                unit_system = self.get_unit_system()
+                diagram_type = self.diagram_type_input.currentText()
+                xmin, xmax, ymin, ymax = self.get_axis_limits()
+                isoline_settings = self.get_isoline_settings()
+                isoline_styles = self.get_isoline_styles()
+
+                # fluprodia clears the axes whenever it draws isolines, so any change of the isoline values
+                # needs a full rebuild of the plot.
+                diagram_key = FluidDiagramPlotter.diagram_key(fluid, unit_system, isoline_settings)
+                plot_key = (diagram_key, diagram_type)
+                states_key = (self.fluid_states, self.connections)
+
+                incremental = self.plotter is not None and plot_key == self._plot_key
+                if not incremental:
+                    diagram = FluidDiagramPlotter.get_cached_diagram(diagram_key)
+                    if diagram is None:
+                        # Calculate the isolines off the GUI thread; update_plot runs again once they are ready.
+                        self.start_diagram_job(diagram_key, fluid, unit_system, isoline_settings)
+                        return
+
+                if incremental:
+                    # Keep the existing plotter and only apply what changed.
+                    self.plotter.apply_styles(isoline_styles)
+                    redraw_background = self.plotter.apply_ranges(xmin, xmax, ymin, ymax)
+                    if states_key != self._states_key:
+                        redraw_background |= self.plotter.apply_states(self.get_fluid_states_soa(self.fluid_states), self.connections)
+                        self._states_key = states_key
+                    self.canvas.set_animated_artists(self.plotter.animated_artists, keep_background=not redraw_background)
+                    incremental = not redraw_background
+                else:
+                    self._plot_key = None
+                    self.canvas.set_animated_artists([])
+                    self.canvas.figure.clear()
+                    self.canvas.axes = self.canvas.figure.add_subplot(111)
+
+                    self.plotter = FluidDiagramPlotter(
+                        self.canvas.figure, self.canvas.axes, fluid_states=self.get_fluid_states_soa(self.fluid_states),
+                        fluid=fluid, unit_system=unit_system, diagram_type=diagram_type,
+                        x_min=xmin, x_max=xmax, y_min=ymin, y_max=ymax, isoline_settings=isoline_settings,
+                        isoline_styles=isoline_styles, diagram=diagram
+                    )
+                    self.plotter.create_plot(self.connections)
+                    self.canvas.set_animated_artists(self.plotter.animated_artists)
+                    self._plot_key = plot_key
+                    self._states_key = states_key
+                self.refresh_canvas(incremental)
+                self.update_button.setStyleSheet("")
+            except ValueError as e:
+                self.show_error_message(f"Error: {str(e)}")
+            except Exception as e:
+                self.show_error_message(f"Unexpected Error: {str(e)}")
+
+    def refresh_canvas(self, incremental=False):
+        """
+        Show the current plot on the active canvas.
+
+        :param incremental: Whether the last draw's background is still valid, which allows blitting.
+        """
+        if self.pg_canvas is not None and self.fast_preview_checkbox.isChecked():
+            self.pg_canvas.mirror_axes(self.canvas.axes)
+            self.canvas.invalidate_buffer()
+        elif incremental:
+            self.canvas.blit_update()
+        else:
+            self.canvas.draw_idle()
+
+    def toggle_fast_preview(self, checked):
+        """
+        Switch between the Matplotlib canvas and the pyqtgraph fast preview.
+        """
+        self.canvas.setVisible(not checked)
+        self.pg_canvas.setVisible(checked)
+        if self.plotter is not None:
+            self.refresh_canvas()
+
+    def start_diagram_job(self, key, fluid, unit_system, isoline_settings):
+        """
+        Calculate a fluid property diagram in the background; the plot is updated once it is ready.
+        """
+        if key in self._diagram_jobs:
+            return
+        job = DiagramJob(key, fluid, unit_system, isoline_settings)
+        job.signals.finished.connect(self.on_diagram_ready)
+        job.signals.failed.connect(self.on_diagram_failed)
+        self._diagram_jobs[key] = job
+        self.update_button.setEnabled(False)
+        QThreadPool.globalInstance().start(job)
+
+    def on_diagram_ready(self, key, diagram):
+        """
+        Cache a diagram calculated in the background and update the plot with it.
+        """
+        self._diagram_jobs.pop(key, None)
+        FluidDiagramPlotter.cache_diagram(key, diagram)
+        if not self._diagram_jobs:
+            self.update_button.setEnabled(True)
+            self.update_plot()
+
+    def on_diagram_failed(self, key, message):
+        """
+        Report a diagram calculation that failed in the background.
+        """
+        self._diagram_jobs.pop(key, None)
+        if not self._diagram_jobs:
+            self.update_button.setEnabled(True)
+        self.show_error_message(f"Error: {message}")
 
     def load_json_files(self):
         """
@@ -609,6 +845,17 @@ class MainWindow(QMainWindow):
         except Exception as e:
             self.show_error_message(f"Error loading JSON files: {str(e)}")
 
+    def get_fluid_states_soa(self, fluid_states):
+        """
+        Convert the loaded fluid states to per-point (2, K) arrays of pressure (bar) and enthalpy (kJ/kg).
+
+        The conversion is done once per loaded file content and reused until the file changes.
+        """
+        if self._fluid_states_soa is None or self._fluid_states_soa[0] is not fluid_states:
+            soa = {name: np.asarray(states, dtype=np.float64).reshape(-1, 2).T for name, states in fluid_states.items()}
+            self._fluid_states_soa = (fluid_states, soa)
+        return self._fluid_states_soa[1]
+
     def get_unit_system(self):
         """
         Retrieve the selected unit system from the input fields.
@@ -631,15 +878,22 @@ class MainWindow(QMainWindow):
     def get_isoline_settings(self):
         """
         Retrieve the isoline settings from the input fields.
+
+        The parsed settings are cached and only rebuilt after an isoline input field changed.
         """
-        return {
-            'Q': {'values': np.linspace(float(self.q_start_input.text()), float(self.q_end_input.text()), int(self.q_points_input.text()))},
-            'T': {'values': np.linspace(float(self.t_start_input.text()), float(self.t_end_input.text()), int(self.t_points_input.text()))},
-            'p': {'values': np.geomspace(float(self.p_start_input.text()), float(self.p_end_input.text()), int(self.p_points_input.text()))},
-            'v': {'values': np.geomspace(float(self.v_start_input.text()), float(self.v_end_input.text()), int(self.v_points_input.text()))},
-            's': {'values': np.linspace(float(self.s_start_input.text()), float(self.s_end_input.text()), int(self.s_points_input.text()))},
-            'h': {'values': np.linspace(float(self.h_start_input.text()), float(self.h_end_input.text()), int(self.h_points_input.text()))}
+        if not self._dirty:
+            return self._isoline_settings
+
+        self._isoline_settings = {
+            'Q': {'values': _lin(float(self.q_start_input.text()), float(self.q_end_input.text()), int(self.q_points_input.text()))},
+            'T': {'values': _lin(float(self.t_start_input.text()), float(self.t_end_input.text()), int(self.t_points_input.text()))},
+            'p': {'values': _geo(float(self.p_start_input.text()), float(self.p_end_input.text()), int(self.p_points_input.text()))},
+            'v': {'values': _geo(float(self.v_start_input.text()), float(self.v_end_input.text()), int(self.v_points_input.text()))},
+            's': {'values': _lin(float(self.s_start_input.text()), float(self.s_end_input.text()), int(self.s_points_input.text()))},
+            'h': {'values': _lin(float(self.h_start_input.text()), float(self.h_end_input.text()), int(self.h_points_input.text()))}
         }
+        self._dirty = False
+        return self._isoline_settings
 
     def get_isoline_styles(self):
         """
@@ -668,14 +922,23 @@ class MainWindow(QMainWindow):
             except ValueError:
                 dpi = 100
 
-            self.canvas.figure.savefig(file_path, format=file_format, dpi=dpi)
+            self.canvas.save_figure(file_path, format=file_format, dpi=dpi)
 
     def load_json_file(self, file_path):
         """
         Load a JSON file and return its content.
+
+        The parsed content is cached and only reloaded when the file's modification time changes.
         """
-        with open(file_path, 'r') as file:
-            return json.load(file)
+        mtime = os.stat(file_path).st_mtime_ns
+        cached = self._json_cache.get(file_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        with open(file_path, 'rb') as file:
+            content = orjson.loads(file.read()) if orjson else json.load(file)
+        self._json_cache[file_path] = (mtime, content)
+        return content
 
     def select_fluid_states_file(self):
         """
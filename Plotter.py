@@ -1,14 +1,77 @@
-from CoolProp.CoolProp import PropsSI
+from contextlib import contextmanager
+from functools import lru_cache
+from CoolProp.CoolProp import AbstractState, HmassP_INPUTS
 from fluprodia import FluidPropertyDiagram
-from matplotlib.colors import Normalize
+from matplotlib.colors import Normalize, to_rgba
 from matplotlib.cm import ScalarMappable
+from matplotlib.collections import LineCollection, PathCollection
 import numpy as np
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
 
+try:
+    import pyqtgraph as pg
+except ImportError:
+    pg = None
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
 plt.style.use('seaborn-v0_8-whitegrid')
 
+# Factors converting SI values (Pa, J/kgK, J/kg, m^3/kg) to the selectable units.
+_SI_TO_UNIT = {
+    'p': {'Pa': 1.0, 'hPa': 1e-2, 'mbar': 1e-2, 'psi': 0.0001450377, 'kPa': 1e-3, 'bar': 1e-5, 'MPa': 1e-6},
+    's': {'J/kgK': 1.0, 'kJ/kgK': 1e-3, 'MJ/kgK': 1e-6},
+    'h': {'J/kg': 1.0, 'kJ/kg': 1e-3, 'MJ/kg': 1e-6},
+    'v': {'m^3/kg': 1.0, 'l/kg': 1e3}
+}
+
+# (scale, offset) pairs converting temperatures from Kelvin to the selectable units.
+_T_FROM_K = {'K': (1.0, 0.0), '°C': (1.0, -273.15), '°F': (1.8, -459.67)}
+
+# Diagram types whose axes need properties from the equation of state; log(p)-h plots the inputs directly.
+_EOS_DIAGRAMS = frozenset({'Ts', 'hs', 'Th', 'plogv'})
+
+# Diagrams with calculated isolines, keyed by FluidDiagramPlotter.diagram_key, least recently used first.
+_ISOLINE_CACHE = {}
+_ISOLINE_CACHE_SIZE = 8
+
+
+@lru_cache(maxsize=None)
+def _make_state_converter(diagram_type, unit_items):
+    """
+    Build a function converting SI state properties to the plotted coordinates of a diagram.
+
+    The unit factors and the axis selection are resolved once per (diagram_type, unit system), so the
+    returned function only performs the two conversions needed for the diagram's axes. It operates on
+    scalars as well as on whole NumPy arrays of states.
+
+    :param diagram_type: The type of diagram (e.g., 'Ts', 'hs', 'logph').
+    :param unit_items: The unit system as a tuple of (property, unit) pairs.
+    :return: Function mapping (T, S, v, p_pa, h_jkg) to the formatted state for plotting.
+    """
+    units = dict(unit_items)
+    T_scale, T_offset = _T_FROM_K.get(units['T'], (1.0, 0.0))
+    s_scale = _SI_TO_UNIT['s'].get(units['s'], 1.0)
+    h_scale = _SI_TO_UNIT['h'].get(units['h'], 1.0)
+    v_scale = _SI_TO_UNIT['v'].get(units['v'], 1.0)
+    p_scale = _SI_TO_UNIT['p'].get(units['p'], 1.0)
+
+    projections = {
+        'Ts': lambda T, S, v, p_pa, h_jkg: (T * T_scale + T_offset, S * s_scale),
+        'hs': lambda T, S, v, p_pa, h_jkg: (h_jkg * h_scale, S * s_scale),
+        'logph': lambda T, S, v, p_pa, h_jkg: (p_pa * p_scale, h_jkg * h_scale),
+        'Th': lambda T, S, v, p_pa, h_jkg: (T * T_scale + T_offset, h_jkg * h_scale),
+        'plogv': lambda T, S, v, p_pa, h_jkg: (v * v_scale, p_pa * p_scale)
+    }
+    if diagram_type not in projections:
+        raise ValueError(f"Unsupported diagram type: {diagram_type}")
+    return projections[diagram_type]
+
 
 class FluidDiagramPlotter:
     """
@@ -26,13 +89,19 @@ class FluidDiagramPlotter:
         y_max (float): The maximum value for the y-axis.
         isoline_settings (dict): Settings for the isolines (e.g., values for Q, T, p, etc.).
         isoline_styles (dict): Styles for the isolines (e.g., color, linestyle).
-        diagram (FluidPropertyDiagram): An instance of FluidPropertyDiagram for plotting the diagram.
+        diagram (FluidPropertyDiagram): An instance of FluidPropertyDiagram for plotting the diagram. A
+            previously calculated diagram can be passed in to skip the isoline calculation.
         label_fontsize (int): Font size for the labels on the isolines.
+        isoline_artists (dict): Drawn isoline lines and labels grouped by isoline property.
+        isoline_layer (list): Drawn isoline lines and labels in drawing order.
+        connections (list): Connections between the plotted fluid states.
+        state_layer (list): Drawn fluid state markers, labels, and connections.
+        animated_artists (list): Artists drawn on top of the cached background when blitting.
     """
 
     def __init__(self, fig, ax, fluid_states, fluid='H2O', unit_system=None,
                  diagram_type='Ts', x_min=0.01, x_max=10000, y_min=0.01, y_max=1000,
-                 isoline_settings=None, isoline_styles=None, label_fontsize=8):
+                 isoline_settings=None, isoline_styles=None, label_fontsize=8, diagram=None):
         self.fig = fig
         self.ax = ax
         self.fluid = fluid
@@ -44,13 +113,86 @@ class FluidDiagramPlotter:
         self.y_max = y_max
         self.isoline_settings = isoline_settings or self.default_isoline_settings()
         self.isoline_styles = isoline_styles or self.default_isoline_styles()
+        self._state = AbstractState('HEOS', self.fluid)
         self.states = self.convert_states(fluid_states, diagram_type)
-        self.diagram = FluidPropertyDiagram(fluid=self.fluid)
-        self.diagram.set_unit_system(**self.unit_system)
-        self.diagram.set_isolines(**{k: v['values'] for k, v in self.isoline_settings.items()})
-        self.diagram.calc_isolines()
+        self.diagram = diagram or self.cached_diagram(self.fluid, self.unit_system, self.isoline_settings)
         self.cbar = None
+        self._last_num_states = None
+        self._color_cache = {}
+        self._annotation_artists = {}
         self.label_fontsize = label_fontsize
+        self.isoline_artists = None
+        self.isoline_layer = []
+        self.connections = []
+        self.state_layer = []
+        self.animated_artists = []
+        self._isoline_data = self.build_isoline_data(self.isoline_settings)
+
+    @staticmethod
+    def build_diagram(fluid, unit_system, isoline_settings):
+        """
+        Create a FluidPropertyDiagram and calculate its isolines.
+
+        :param fluid: The fluid name (e.g., 'H2O', 'CO2').
+        :param unit_system: The unit system for the fluid properties.
+        :param isoline_settings: Settings for the isolines (e.g., values for Q, T, p, etc.).
+        :return: FluidPropertyDiagram with calculated isolines.
+        """
+        diagram = FluidPropertyDiagram(fluid=fluid)
+        diagram.set_unit_system(**unit_system)
+        diagram.set_isolines(**{k: v['values'] for k, v in isoline_settings.items()})
+        diagram.calc_isolines()
+        return diagram
+
+    @staticmethod
+    def diagram_key(fluid, unit_system, isoline_settings):
+        """
+        Return the key identifying a diagram with calculated isolines for the given settings.
+        """
+        return fluid, tuple(unit_system.items()), tuple((k, tuple(v['values'])) for k, v in isoline_settings.items())
+
+    @classmethod
+    def cached_diagram(cls, fluid, unit_system, isoline_settings):
+        """
+        Return a diagram with calculated isolines, reusing a previously calculated one for the same settings.
+
+        :param fluid: The fluid name (e.g., 'H2O', 'CO2').
+        :param unit_system: The unit system for the fluid properties.
+        :param isoline_settings: Settings for the isolines (e.g., values for Q, T, p, etc.).
+        :return: FluidPropertyDiagram with calculated isolines.
+        """
+        key = cls.diagram_key(fluid, unit_system, isoline_settings)
+        diagram = cls.get_cached_diagram(key)
+        if diagram is None:
+            diagram = cls.build_diagram(fluid, unit_system, isoline_settings)
+            cls.cache_diagram(key, diagram)
+        return diagram
+
+    @staticmethod
+    def get_cached_diagram(key):
+        """
+        Return the cached diagram for the given key and mark it as recently used.
+
+        :param key: Key of the diagram as returned by :meth:`diagram_key`.
+        :return: FluidPropertyDiagram with calculated isolines, or None if it has not been calculated yet.
+        """
+        diagram = _ISOLINE_CACHE.pop(key, None)
+        if diagram is not None:
+            _ISOLINE_CACHE[key] = diagram
+        return diagram
+
+    @staticmethod
+    def cache_diagram(key, diagram):
+        """
+        Store a calculated diagram, evicting the least recently used one when the cache is full.
+
+        :param key: Key of the diagram as returned by :meth:`diagram_key`.
+        :param diagram: FluidPropertyDiagram with calculated isolines.
+        """
+        _ISOLINE_CACHE.pop(key, None)
+        if len(_ISOLINE_CACHE) >= _ISOLINE_CACHE_SIZE:
+            del _ISOLINE_CACHE[next(iter(_ISOLINE_CACHE))]
+        _ISOLINE_CACHE[key] = diagram
 
     @staticmethod
     def default_unit_system():
@@ -94,59 +236,102 @@ class FluidDiagramPlotter:
             'h': {'color': 'brown', 'linestyle': '--', 'linewidth': 2.5}
         }
 
-    @staticmethod
-    def bar_to_Pa(p_bar):
-        """
-        Convert pressure from bar to Pascal.
-
-        :param p_bar: Pressure in bar.
-        :return: Pressure in Pascal.
-        """
-        return p_bar * 1e5
-
     def plot_fluid_states(self, states, connections=None, markersize=6, fontsize=10, cmap='Greys'):
         """
         Plot the fluid states on the diagram.
 
+        The point labels are kept in _annotation_artists and reused on later calls; only labels of new
+        points are created and labels of points that no longer exist are removed.
+
         :param states: Dictionary of fluid states with point names and their values.
         :param connections: List of connections between states.
         :param markersize: Size of the markers for states.
         :param fontsize: Font size for the state labels.
         :param cmap: Colormap for the progression of states.
         """
-        labeled_points = set()
+        xs, ys, colors = [], [], []
+        annotations = {}
         for point_name, point_states in states.items():
-            norm = Normalize(vmin=0, vmax=len(point_states) - 1)
-            scalar_map = ScalarMappable(norm=norm, cmap=cmap)
-            colors = [scalar_map.to_rgba(i) for i in range(len(point_states))]
-
-            for i, (p, h) in enumerate(point_states):
-                color = colors[i]
-                self.ax.plot(h, p, marker='o', color=color, markersize=markersize)
-
-                if point_name not in labeled_points:
-                    self.ax.annotate(
-                        point_name, (h, p), xytext=(10, 5), ha='left', va='center',
-                        textcoords='offset points', fontsize=fontsize, color='black'
-                    )
-                    labeled_points.add(point_name)
+            if not point_states:
+                continue
+            colors.append(self.state_colors(cmap, len(point_states)))
+            ys.extend(p for p, h in point_states)
+            xs.extend(h for p, h in point_states)
+
+            p, h = point_states[0]
+            annotation = self._annotation_artists.pop(point_name, None)
+            if annotation is None:
+                annotation = self.ax.annotate(
+                    point_name, (h, p), xytext=(10, 5), ha='left', va='center',
+                    textcoords='offset points', fontsize=fontsize, color='black'
+                )
+            elif annotation.xy != (h, p):
+                annotation.xy = (h, p)
+            annotations[point_name] = annotation
+
+        for annotation in self._annotation_artists.values():
+            annotation.remove()
+        self._annotation_artists = annotations
+
+        if xs:
+            self.ax.scatter(xs, ys, c=np.concatenate(colors), s=markersize ** 2, zorder=3)
 
         if connections:
             self.plot_connections(states, connections)
 
+    def state_colors(self, cmap, num_states):
+        """
+        Return the RGBA colors for a progression of states, sampled evenly from the colormap.
+
+        :param cmap: Name of the colormap.
+        :param num_states: Number of states in the progression.
+        :return: Array of shape (num_states, 4) with the RGBA colors.
+        """
+        key = (cmap, num_states)
+        if key not in self._color_cache:
+            self._color_cache[key] = plt.get_cmap(cmap)(np.linspace(0, 1, num_states))
+        return self._color_cache[key]
+
     def plot_connections(self, states, connections):
         """
-        Plot the connections between fluid states.
+        Plot the connections between fluid states, one line collection per connection type.
 
         :param states: Dictionary of fluid states.
         :param connections: List of connections between states.
         """
         line_styles = self.connection_line_styles()
+        for line_type, line_segments in self.connection_segments(states, connections).items():
+            style = line_styles[line_type]
+            self.ax.add_collection(LineCollection(
+                line_segments, colors=style['color'], linestyles=style['linestyle'],
+                linewidths=style['linewidth'], zorder=2
+            ), autolim=False)
+
+    def connection_segments(self, states, connections):
+        """
+        Resolve the endpoints of the connections and group the resulting segments by connection type.
+
+        :param states: Dictionary of fluid states.
+        :param connections: List of connections between states.
+        :return: Dictionary mapping connection types to lists of ((x, y), (x, y)) segments.
+        """
+        line_styles = self.connection_line_styles()
+        lookup = {point: point_states[0] for point, point_states in states.items() if point_states}
+
+        def find_state(name):
+            if name in lookup:
+                return lookup[name]
+            state = next((state for point, state in lookup.items() if name in point), None)
+            if state is None:
+                raise ValueError(f"Unknown point in connections: {name}")
+            return state
+
+        segments = {}
         for start, end, line_type in connections:
-            start_state = next(state for point, states in states.items() for state in states if start in point)
-            end_state = next(state for point, states in states.items() for state in states if end in point)
-            style = line_styles.get(line_type, line_styles['default'])
-            self.ax.plot([start_state[1], end_state[1]], [start_state[0], end_state[0]], **style)
+            start_state, end_state = find_state(start), find_state(end)
+            line_type = line_type if line_type in line_styles else 'default'
+            segments.setdefault(line_type, []).append([(start_state[1], start_state[0]), (end_state[1], end_state[0])])
+        return segments
 
     @staticmethod
     def connection_line_styles():
@@ -165,21 +350,167 @@ class FluidDiagramPlotter:
 
         :param connections: List of connections between fluid states.
         """
-        isoline_data = self.get_isoline_data()
+        self.connections = connections
+        self.draw_layers()
+        self.add_color_bar()
+
+    def draw_layers(self):
+        """
+        Draw the isolines and then the fluid states and connections onto the axes.
+
+        fluprodia clears the axes before drawing the isolines, so the state layer is always drawn again
+        on top of them.
+        """
+        isoline_lines, isoline_texts = self.draw_isoline_layer(self.get_isoline_data())
+        self.isoline_artists = self.collect_isoline_artists(isoline_lines, isoline_texts)
+        self.isoline_layer = isoline_lines + isoline_texts
+
+        self._annotation_artists = {}
+        self.state_layer = self.draw_state_layer(self.connections)
+
+        self.animated_artists = self.isoline_layer + self.state_layer
+
+    def apply_states(self, fluid_states, connections):
+        """
+        Replace the plotted fluid states and connections without redrawing the isolines.
+
+        :param fluid_states: Dictionary mapping point names to (2, K) arrays of pressure in bar and enthalpy in kJ/kg.
+        :param connections: List of connections between fluid states.
+        :return: True if the color bar changed, which invalidates the cached background.
+        """
+        # Resolve the new states and connections first, so invalid input leaves the drawn state layer intact.
+        states = self.convert_states(fluid_states, self.diagram_type)
+        self.connection_segments(states, connections)
+
+        annotations = set(self._annotation_artists.values())
+        for artist in self.state_layer:
+            if artist not in annotations:
+                artist.remove()
+        self.state_layer = []
+
+        self.states = states
+        self.connections = connections
+        self.state_layer = self.draw_state_layer(connections)
+        self.animated_artists = self.isoline_layer + self.state_layer
+        return self.add_color_bar()
+
+    def draw_state_layer(self, connections):
+        """
+        Plot the fluid states and connections and return the artists of the state layer.
+
+        :param connections: List of connections between fluid states.
+        :return: List of the created artists and the point labels.
+        """
+        num_lines, num_collections = len(self.ax.lines), len(self.ax.collections)
+        self.plot_fluid_states(self.states, connections=connections)
+        return (list(self.ax.lines)[num_lines:] + list(self.ax.collections)[num_collections:]
+                + list(self._annotation_artists.values()))
+
+    def draw_isoline_layer(self, isoline_data):
+        """
+        Draw isolines on the axes and return the created artists.
+
+        fluprodia clears the axes first, so all lines and texts on the axes afterwards are isoline artists.
+
+        :param isoline_data: Dictionary containing isoline data and styles.
+        :return: Tuple of the created line artists and label artists.
+        """
         self.diagram.draw_isolines(fig=self.fig, ax=self.ax, diagram_type=self.diagram_type,
                                    x_min=self.x_min, x_max=self.x_max, y_min=self.y_min, y_max=self.y_max,
                                    isoline_data=isoline_data)
 
-        for text in self.ax.texts:
+        texts = list(self.ax.texts)
+        for text in texts:
             text.set_fontsize(self.label_fontsize)
-
-        self.plot_fluid_states(self.states, connections=connections)
-        self.add_color_bar()
+        return list(self.ax.lines), texts
+
+    def collect_isoline_artists(self, lines, texts):
+        """
+        Group the drawn isoline lines and labels by the isoline property they belong to.
+
+        Every isoline line carries the gid of its property (see :meth:`build_isoline_data`). fluprodia
+        draws the label of an isoline right after its line, so labels are attributed to the property of
+        the preceding line in drawing order.
+
+        :param lines: Line artists created while drawing the isolines.
+        :param texts: Text artists created while drawing the isolines.
+        :return: Dictionary mapping each isoline property to its artists.
+        """
+        artists = {k: {'lines': [], 'texts': []} for k in self.isoline_settings}
+        lines, texts = set(lines), set(texts)
+        current = None
+        for artist in self.ax.get_children():
+            if artist in lines:
+                gid = artist.get_gid() or ''
+                current = gid[len('isoline-'):] if gid.startswith('isoline-') else None
+                if current in artists:
+                    artists[current]['lines'].append(artist)
+                else:
+                    current = None
+            elif artist in texts and current is not None:
+                artists[current]['texts'].append(artist)
+        return artists
+
+    def apply_ranges(self, x_min, x_max, y_min, y_max):
+        """
+        Apply new axis limits to the existing plot.
+
+        fluprodia only draws the isoline segments inside the axis range and places the labels for it, so
+        the isolines are drawn again from the already calculated diagram.
+
+        :param x_min: The minimum value for the x-axis.
+        :param x_max: The maximum value for the x-axis.
+        :param y_min: The minimum value for the y-axis.
+        :param y_max: The maximum value for the y-axis.
+        :return: True if the axis limits changed.
+        """
+        if (x_min, x_max, y_min, y_max) == (self.x_min, self.x_max, self.y_min, self.y_max):
+            return False
+        self.x_min, self.x_max, self.y_min, self.y_max = x_min, x_max, y_min, y_max
+        self.draw_layers()
+        return True
+
+    def apply_styles(self, isoline_styles):
+        """
+        Apply new styles to the already drawn isolines without recalculating them.
+
+        :param isoline_styles: Styles for the isolines (e.g., color, linestyle).
+        """
+        if isoline_styles != self.isoline_styles:
+            self.invalidate_isolines()
+        self.isoline_styles = isoline_styles
+        for k, artists in self.isoline_artists.items():
+            style = isoline_styles[k]
+            for line in artists['lines']:
+                line.set_color(style['color'])
+                line.set_linestyle(style['linestyle'])
+                line.set_linewidth(style.get('linewidth', 1))
 
     def get_isoline_data(self):
         """
         Retrieve the isoline data with styles.
 
+        The data is built once and reused until :meth:`invalidate_isolines`.
+
+        :return: Dictionary containing isoline data and styles.
+        """
+        if self._isoline_data is None:
+            self._isoline_data = self.build_isoline_data(self.isoline_settings)
+        return self._isoline_data
+
+    def invalidate_isolines(self):
+        """
+        Discard the cached isoline data, e.g. after the isoline settings or styles changed.
+        """
+        self._isoline_data = None
+
+    def build_isoline_data(self, isoline_settings):
+        """
+        Combine isoline settings with the isoline styles.
+
+        Each style carries a gid naming the isoline property, which fluprodia passes on to the drawn lines.
+
+        :param isoline_settings: Settings for the isolines (e.g., values for Q, T, p, etc.).
         :return: Dictionary containing isoline data and styles.
         """
         return {
@@ -188,176 +519,292 @@ class FluidDiagramPlotter:
                 'style': {
                     'color': self.isoline_styles[k]['color'],
                     'linestyle': self.isoline_styles[k]['linestyle'],
-                    'linewidth': self.isoline_styles[k].get('linewidth', 1)
+                    'linewidth': self.isoline_styles[k].get('linewidth', 1),
+                    'gid': f'isoline-{k}'
                 }
-            } for k, v in self.isoline_settings.items()
+            } for k, v in isoline_settings.items()
         }
 
     def add_color_bar(self):
         """
         Add a color bar to the plot to indicate time progression of states.
+
+        An existing color bar is kept as is if the number of states did not change and is updated in
+        place otherwise, so the figure layout is not rebuilt.
+
+        :return: True if the color bar was created or changed.
         """
-        num_states = len(next(iter(self.states.values())))
-        if self.cbar:
-            self.cbar.remove()
-        self.cbar = self.fig.colorbar(ScalarMappable(norm=Normalize(vmin=0, vmax=num_states - 1), cmap='Greys'), ax=self.ax, pad=0.1)
-        self.cbar.set_label('Time Progression')
+        num_states = len(next(iter(self.states.values()))) if self.states else 0
+        if num_states == 0 or (self.cbar is not None and num_states == self._last_num_states):
+            return False
+
+        norm = Normalize(vmin=0, vmax=num_states - 1)
+        if self.cbar is None:
+            self.cbar = self.fig.colorbar(ScalarMappable(norm=norm, cmap='Greys'), ax=self.ax, pad=0.1)
+            self.cbar.set_label('Time Progression')
+        else:
+            self.cbar.mappable.set_norm(norm)
+            self.cbar.update_normal(self.cbar.mappable)
         self.cbar.set_ticks(range(num_states))
         self.cbar.set_ticklabels([str(i + 1) for i in range(num_states)])
+        self._last_num_states = num_states
+        return True
 
     def convert_states(self, fluid_states, target_diagram):
         """
         Convert fluid states based on the target diagram type.
 
-        :param fluid_states: Dictionary of fluid states.
+        :param fluid_states: Dictionary mapping point names to (2, K) arrays of pressure in bar and enthalpy in kJ/kg.
         :param target_diagram: The type of diagram (e.g., 'Ts', 'hs', 'logph').
         :return: Converted fluid states.
         """
-        converted_states = {}
-        for point_name, point_states in fluid_states.items():
-            converted_states[point_name] = []
-            for p_bar, h_kjkg in point_states:
-                p_pa = self.bar_to_Pa(p_bar)
-                h_jkg = h_kjkg * 1e3
-                T, S, v = self.calculate_properties(p_pa, h_jkg)
-                Ta, Sa, va, pa, ha = self.convert_units(T, S, v, p_pa, h_jkg)
-                converted_states[point_name].append(self.format_converted_state(target_diagram, Ta, Sa, va, pa, ha))
-        return converted_states
+        convert_state = _make_state_converter(target_diagram, tuple(self.unit_system.items()))
+        if not fluid_states:
+            return {}
+
+        # Evaluate all states of all points in one batch and split the results back per point.
+        point_names = list(fluid_states)
+        p_bar = np.concatenate([fluid_states[point_name][0] for point_name in point_names])
+        h_kjkg = np.concatenate([fluid_states[point_name][1] for point_name in point_names])
+        splits = np.cumsum([fluid_states[point_name].shape[1] for point_name in point_names])[:-1]
+
+        p_pa = p_bar * 1.0e5
+        h_jkg = h_kjkg * 1.0e3
+        T = S = v = None
+        if target_diagram in _EOS_DIAGRAMS:
+            T, S, v = self.calculate_properties(p_pa, h_jkg)
+        ys, xs = convert_state(T, S, v, p_pa, h_jkg)
+
+        return {
+            point_name: list(zip(y.tolist(), x.tolist()))
+            for point_name, y, x in zip(point_names, np.split(ys, splits), np.split(xs, splits))
+        }
 
     def calculate_properties(self, p_pa, h_jkg):
         """
         Calculate temperature, entropy, and specific volume for given pressure and enthalpy.
 
-        :param p_pa: Pressure in Pascal.
-        :param h_jkg: Enthalpy in J/kg.
-        :return: Tuple containing temperature, entropy, and specific volume.
-        """
-        T = PropsSI('T', 'P', p_pa, 'H', h_jkg, self.fluid)
-        S = PropsSI('S', 'P', p_pa, 'H', h_jkg, self.fluid)
-        v = 1 / PropsSI('D', 'P', p_pa, 'H', h_jkg, self.fluid)
+        The cached AbstractState solves each state once and returns all three properties from it.
+
+        :param p_pa: Array of pressures in Pascal.
+        :param h_jkg: Array of enthalpies in J/kg.
+        :return: Tuple of arrays containing temperature, entropy, and specific volume.
+        """
+        p_pa = np.atleast_1d(np.asarray(p_pa, dtype=np.float64))
+        h_jkg = np.atleast_1d(np.asarray(h_jkg, dtype=np.float64))
+        T, S, v = np.empty_like(p_pa), np.empty_like(p_pa), np.empty_like(p_pa)
+        state = self._state
+        for i in range(p_pa.size):
+            state.update(HmassP_INPUTS, h_jkg[i], p_pa[i])
+            T[i] = state.T()
+            S[i] = state.smass()
+            v[i] = 1.0 / state.rhomass()
         return T, S, v
 
-    def convert_units(self, T, S, v, p_pa, h_jkg):
-        """
-        Convert the calculated properties to the selected unit system.
 
-        :param T: Temperature in Kelvin.
-        :param S: Entropy in J/kg·K.
-        :param v: Specific volume in m^3/kg.
-        :param p_pa: Pressure in Pascal.
-        :param h_jkg: Enthalpy in J/kg.
-        :return: Tuple containing converted temperature, entropy, specific volume, pressure, and enthalpy.
-        """
-        Ta = self.convert_temperature(T)
-        Sa = self.convert_entropy(S)
-        va = self.convert_volume(v)
-        pa = self.convert_pressure(p_pa)
-        ha = self.convert_enthalpy(h_jkg)
-        return Ta, Sa, va, pa, ha
+@contextmanager
+def defer_draw(canvas):
+    """
+    Collect the draw_idle requests of a canvas made inside the block into a single draw on exit.
+
+    :param canvas: The MplCanvas whose draws are deferred. Nested blocks only draw when the outermost one exits.
+    """
+    canvas._defer_depth += 1
+    try:
+        yield canvas
+    finally:
+        canvas._defer_depth -= 1
+        if canvas._defer_depth == 0 and canvas._draw_pending:
+            canvas._draw_pending = False
+            canvas.draw_idle()
+
+
+class MplCanvas(FigureCanvas):
+    """
+    Class representing a Matplotlib canvas for embedding plots in a PyQt5 application.
+
+    Artists registered with :meth:`set_animated_artists` are excluded from the regular draw and
+    blitted on top of a cached background, so they can be restyled without re-rendering the axes.
+    """
 
-    def convert_temperature(self, T):
+    def __init__(self, parent=None, width=5, height=10, dpi=100):
+        self.figure = Figure(figsize=(width, height), dpi=dpi)
+        self.axes = self.figure.add_subplot(111)
+        super(MplCanvas, self).__init__(self.figure)
+        self._bg = None
+        self._defer_depth = 0
+        self._draw_pending = False
+        self._saving = False
+        self._buffer_current = False
+        self.animated_artists = []
+        self.mpl_connect('draw_event', self.on_draw)
+
+    def draw_idle(self):
+        """
+        Request a redraw, or postpone it while draws are deferred with :func:`defer_draw`.
         """
-        Convert temperature to the selected unit system.
+        self._buffer_current = False
+        if getattr(self, '_defer_depth', 0):
+            self._draw_pending = True
+            return
+        super(MplCanvas, self).draw_idle()
 
-        :param T: Temperature in Kelvin.
-        :return: Converted temperature.
+    def set_animated_artists(self, artists, keep_background=False):
         """
-        if self.unit_system['T'] == '°C':
-            return T - 273.15
-        elif self.unit_system['T'] == '°F':
-            return (T - 273.15) * 9/5 + 32
-        return T
+        Register the artists to be drawn on top of the cached background.
 
-    def convert_entropy(self, S):
+        :param artists: List of artists to animate.
+        :param keep_background: Keep the cached background, e.g. when artists were only added to the plot.
         """
-        Convert entropy to the selected unit system.
+        if not keep_background:
+            self._bg = None
+        self._buffer_current = False
+        self.animated_artists = sorted(artists, key=lambda artist: artist.get_zorder())
+        for artist in self.animated_artists:
+            artist.set_animated(True)
 
-        :param S: Entropy in J/kg·K.
-        :return: Converted entropy.
+    def on_draw(self, event):
         """
-        if self.unit_system['s'] == 'kJ/kgK':
-            return S / 1e3
-        elif self.unit_system['s'] == 'MJ/kgK':
-            return S / 1e6
-        return S
+        Cache the freshly rendered background and draw the animated artists on top of it.
 
-    def convert_volume(self, v):
+        Draws made by :meth:`save_figure` are skipped: they render the exported file, not the screen.
         """
-        Convert specific volume to the selected unit system.
+        if self._saving:
+            return
+        self._bg = self.copy_from_bbox(self.figure.bbox)
+        self.draw_animated_artists()
+        self._buffer_current = True
 
-        :param v: Specific volume in m^3/kg.
-        :return: Converted specific volume.
+    def draw_animated_artists(self):
         """
-        if self.unit_system['v'] == 'l/kg':
-            return v * 1e3
-        return v
+        Draw all animated artists onto the current renderer.
+        """
+        for artist in self.animated_artists:
+            self.figure.draw_artist(artist)
 
-    def convert_pressure(self, p_pa):
+    def blit_update(self):
+        """
+        Redraw the animated artists on top of the cached background, falling back to a full draw.
         """
-        Convert pressure to the selected unit system.
+        if self._bg is None:
+            self.draw_idle()
+            return
+        self.restore_region(self._bg)
+        self.draw_animated_artists()
+        self.blit(self.figure.bbox)
+        self._buffer_current = True
 
-        :param p_pa: Pressure in Pascal.
-        :return: Converted pressure.
+    def invalidate_buffer(self):
         """
-        if self.unit_system['p'] == 'hPa':
-            return p_pa / 1e2
-        elif self.unit_system['p'] == 'mbar':
-            return p_pa / 1e2
-        elif self.unit_system['p'] == 'psi':
-            return p_pa * 0.0001450377
-        elif self.unit_system['p'] == 'kPa':
-            return p_pa / 1e3
-        elif self.unit_system['p'] == 'bar':
-            return p_pa / 1e5
-        elif self.unit_system['p'] == 'MPa':
-            return p_pa / 1e6
-        return p_pa
+        Mark the rendered Agg buffer as out of date, e.g. after the plot changed without being drawn here.
+        """
+        self._buffer_current = False
 
-    def convert_enthalpy(self, h_jkg):
+    def save_figure(self, file_path, **kwargs):
         """
-        Convert enthalpy to the selected unit system.
+        Save the figure including the animated artists, which a regular save would skip.
+
+        If a PNG is requested at the on-screen resolution and the Agg buffer holds the current plot,
+        including the animated artists, it is written directly instead of rendering the figure again.
 
-        :param h_jkg: Enthalpy in J/kg.
-        :return: Converted enthalpy.
+        :param file_path: Path of the file to write.
+        :param kwargs: Additional keyword arguments passed to ``Figure.savefig``.
         """
-        if self.unit_system['h'] == 'kJ/kg':
-            return h_jkg / 1e3
-        elif self.unit_system['h'] == 'MJ/kg':
-            return h_jkg / 1e6
-        return h_jkg
+        dpi = kwargs.get('dpi')
+        if (Image is not None and self._buffer_current and not self.figure.stale
+                and kwargs.get('format') == 'png' and dpi == self.figure.dpi):
+            Image.frombuffer('RGBA', self.get_width_height(physical=True), self.buffer_rgba(),
+                             'raw', 'RGBA', 0, 1).save(file_path, format='PNG', dpi=(dpi, dpi))
+            return
 
-    @staticmethod
-    def format_converted_state(diagram_type, Ta, Sa, va, pa, ha):
-        """
-        Format the converted state based on the diagram type.
-
-        :param diagram_type: The type of diagram.
-        :param Ta: Converted temperature.
-        :param Sa: Converted entropy.
-        :param va: Converted specific volume.
-        :param pa: Converted pressure.
-        :param ha: Converted enthalpy.
-        :return: Tuple containing the formatted state for plotting.
-        """
-        if diagram_type == 'Ts':
-            return Ta, Sa
-        elif diagram_type == 'hs':
-            return ha, Sa
-        elif diagram_type == 'logph':
-            return pa, ha
-        elif diagram_type == 'Th':
-            return Ta, ha
-        elif diagram_type == 'plogv':
-            return va, pa
-        raise ValueError(f"Unsupported diagram type: {diagram_type}")
+        for artist in self.animated_artists:
+            artist.set_animated(False)
+        self._saving = True
+        try:
+            self.figure.savefig(file_path, **kwargs)
+        finally:
+            self._saving = False
+            # An Agg export re-renders this canvas at the export resolution, so the cached background is stale.
+            self._bg = None
+            self._buffer_current = False
+            for artist in self.animated_artists:
+                artist.set_animated(True)
 
 
-class MplCanvas(FigureCanvas):
-    """
-    Class representing a Matplotlib canvas for embedding plots in a PyQt5 application.
-    """
+if pg is not None:
+    class PgCanvas(pg.PlotWidget):
+        """
+        Class representing a pyqtgraph canvas used as a fast interactive preview of a Matplotlib plot.
 
-    def __init__(self, parent=None, width=5, height=10, dpi=100):
-        self.figure = Figure(figsize=(width, height), dpi=dpi)
-        self.axes = self.figure.add_subplot(111)
-        super(MplCanvas, self).__init__(self.figure)
+        The Matplotlib axes remain the source of the plot; their lines and labels are mirrored onto the
+        Qt scene graph, which avoids the Agg rasterization on every update.
+        """
+
+        LINE_STYLES = {
+            '-': pg.QtCore.Qt.SolidLine,
+            '--': pg.QtCore.Qt.DashLine,
+            '-.': pg.QtCore.Qt.DashDotLine,
+            ':': pg.QtCore.Qt.DotLine
+        }
+
+        def __init__(self, parent=None):
+            super(PgCanvas, self).__init__(parent, background='w')
+
+        @staticmethod
+        def qt_color(color):
+            """
+            Convert a Matplotlib color to an RGBA tuple with 0-255 components.
+            """
+            return tuple(int(round(255 * c)) for c in to_rgba(color))
+
+        def mirror_axes(self, ax):
+            """
+            Redraw the lines, line collections, scatter markers and labels of the given Matplotlib axes on this canvas.
+
+            :param ax: The Matplotlib axes to mirror.
+            """
+            self.clear()
+            x_log, y_log = ax.get_xscale() == 'log', ax.get_yscale() == 'log'
+            self.setLogMode(x=x_log, y=y_log)
+
+            for line in ax.lines:
+                color = self.qt_color(line.get_color())
+                if line.get_marker() in (None, 'None', '', ' '):
+                    pen = pg.mkPen(color=color, width=line.get_linewidth(),
+                                   style=self.LINE_STYLES.get(line.get_linestyle(), pg.QtCore.Qt.SolidLine))
+                    self.plot(line.get_xdata(), line.get_ydata(), pen=pen)
+                else:
+                    self.plot(line.get_xdata(), line.get_ydata(), pen=None, symbol='o',
+                              symbolBrush=color, symbolPen=color, symbolSize=line.get_markersize())
+
+            for collection in ax.collections:
+                if isinstance(collection, LineCollection):
+                    colors, widths = collection.get_colors(), collection.get_linewidths()
+                    for i, segment in enumerate(collection.get_segments()):
+                        pen = pg.mkPen(color=self.qt_color(colors[i % len(colors)]), width=widths[i % len(widths)])
+                        self.plot(segment[:, 0], segment[:, 1], pen=pen)
+                elif isinstance(collection, PathCollection):
+                    offsets, sizes = collection.get_offsets(), collection.get_sizes()
+                    rgba = np.rint(np.asarray(collection.get_facecolors()) * 255).astype(int)
+                    brushes = [pg.mkBrush(*color) for color in rgba.tolist()]
+                    if len(brushes) == 1:
+                        brushes = brushes[0]
+                    self.plot(offsets[:, 0], offsets[:, 1], pen=None, symbol='o', symbolBrush=brushes,
+                              symbolPen=None, symbolSize=np.sqrt(sizes[0]) if len(sizes) else 6)
+
+            for text in ax.texts:
+                x, y = getattr(text, 'xy', text.get_position())
+                if (x_log and x <= 0) or (y_log and y <= 0):
+                    continue
+                item = pg.TextItem(text.get_text(), color=self.qt_color(text.get_color()))
+                item.setPos(np.log10(x) if x_log else x, np.log10(y) if y_log else y)
+                self.addItem(item)
+
+            self.setLabel('bottom', ax.get_xlabel())
+            self.setLabel('left', ax.get_ylabel())
+            x_min, x_max = ax.get_xlim()
+            y_min, y_max = ax.get_ylim()
+            self.setXRange(*(np.log10([x_min, x_max]) if x_log else (x_min, x_max)), padding=0)
+            self.setYRange(*(np.log10([y_min, y_max]) if y_log else (y_min, y_max)), padding=0)
+else:
+    PgCanvas = None